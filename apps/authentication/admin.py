@@ -0,0 +1,22 @@
+from django.contrib import admin
+from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.contrib.auth.models import User
+
+
+class UserAdmin(BaseUserAdmin):
+    """User admin without the full Permission multi-select on the change form"""
+    filter_horizontal = ()
+    raw_id_fields = ['groups']
+    list_per_page = 50
+    
+    fieldsets = tuple(
+        (name, {
+            **options,
+            'fields': tuple(f for f in options['fields'] if f != 'user_permissions'),
+        })
+        for name, options in BaseUserAdmin.fieldsets
+    )
+
+
+admin.site.unregister(User)
+admin.site.register(User, UserAdmin)
@@ -27,11 +27,10 @@ class RegisterSerializer(serializers.ModelSerializer):
         user = User.objects.create_user(
             username=validated_data['username'],
             email=validated_data['email'],
+            password=validated_data['password'],
             first_name=validated_data.get('first_name', ''),
             last_name=validated_data.get('last_name', ''),
         )
-        user.set_password(validated_data['password'])
-        user.save()
         
         # Create profile for user
         Profile.objects.create(user=user)
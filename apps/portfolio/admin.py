@@ -1,4 +1,8 @@
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Count, Q
+from django.utils.functional import cached_property
 from .models import (
     Post, Comment, Profile, SiteConfig, 
     Course, CourseItem, AcademyVideo, AcademyExercise, 
@@ -6,21 +10,70 @@ from .models import (
 )
 
 
+# Below this many rows an exact COUNT(*) is cheap enough to keep
+ESTIMATED_COUNT_THRESHOLD = 10000
+
+
+class NoCountPaginator(Paginator):
+    """Use the planner's row estimate instead of COUNT(*) on large unfiltered changelists"""
+    
+    @cached_property
+    def count(self):
+        # Filtered/searched lists are usually small: keep the exact count
+        if not self.object_list.query.where:
+            estimate = self._estimated_count()
+            if estimate is not None and estimate >= ESTIMATED_COUNT_THRESHOLD:
+                return estimate
+        return super().count
+    
+    def _estimated_count(self):
+        """Approximate table row count, None when the backend keeps no estimate"""
+        connection = connections[self.object_list.db]
+        table = self.object_list.model._meta.db_table
+        if connection.vendor == 'postgresql':
+            sql = 'SELECT reltuples::bigint FROM pg_class WHERE relname = %s'
+        elif connection.vendor == 'mysql':
+            sql = (
+                'SELECT table_rows FROM information_schema.tables '
+                'WHERE table_schema = DATABASE() AND table_name = %s'
+            )
+        else:
+            return None
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [table])
+            row = cursor.fetchone()
+        # reltuples is -1 for a table that has never been analysed
+        if not row or row[0] is None or row[0] < 0:
+            return None
+        return int(row[0])
+
+
 @admin.register(Post)
 class PostAdmin(admin.ModelAdmin):
     list_display = ['title', 'author', 'media_type', 'is_published', 'created_at']
+    paginator = NoCountPaginator
+    show_full_result_count = False
     list_filter = ['is_published', 'media_type', 'created_at']
     search_fields = ['title', 'content']
-    date_hierarchy = 'created_at'
     readonly_fields = ['created_at', 'updated_at']
+    
+    def get_queryset(self, request):
+        qs = super().get_queryset(request).select_related('author')
+        # The changelist never shows content/media: keep rows small
+        match = request.resolver_match
+        if match and match.url_name and match.url_name.endswith('_changelist'):
+            qs = qs.only('id', 'title', 'author__username', 'media_type', 'is_published', 'created_at')
+        return qs
 
 
 @admin.register(Comment)
 class CommentAdmin(admin.ModelAdmin):
     list_display = ['author', 'post', 'is_approved', 'created_at']
+    paginator = NoCountPaginator
+    show_full_result_count = False
     list_filter = ['is_approved', 'created_at']
     search_fields = ['content', 'author__username']
-    date_hierarchy = 'created_at'
+    list_select_related = ['author', 'post']
 
 
 @admin.register(Profile)
@@ -56,7 +109,6 @@ class CourseAdmin(admin.ModelAdmin):
     list_display = ['title', 'level', 'order', 'is_active', 'is_featured', 'get_items_count', 'created_at']
     list_filter = ['level', 'is_active', 'is_featured', 'created_at']
     search_fields = ['title', 'description']
-    prepopulated_fields = {'slug': ('title',)}
     ordering = ['order', '-created_at']
     list_editable = ['order', 'is_active', 'is_featured']
     readonly_fields = ['created_at', 'updated_at']
@@ -78,8 +130,15 @@ class CourseAdmin(admin.ModelAdmin):
         }),
     )
     
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        return qs.annotate(
+            _videos_n=Count('items', filter=Q(items__content_type='video'), distinct=True),
+            _exercises_n=Count('items', filter=Q(items__content_type='exercise'), distinct=True),
+        )
+    
     def get_items_count(self, obj):
-        return f"📹 {obj.get_videos_count()} | 💻 {obj.get_exercises_count()}"
+        return f"📹 {obj._videos_n} | 💻 {obj._exercises_n}"
     get_items_count.short_description = 'Contenu'
 
 
@@ -90,6 +149,7 @@ class CourseItemAdmin(admin.ModelAdmin):
     search_fields = ['course__title', 'video__title', 'exercise__title']
     ordering = ['course', 'order']
     list_editable = ['order', 'is_required']
+    list_select_related = ['course', 'video', 'exercise']
     
     def get_content_title(self, obj):
         content = obj.get_content()
@@ -154,18 +214,30 @@ class AcademyExerciseAdmin(admin.ModelAdmin):
 @admin.register(UserProgress)
 class UserProgressAdmin(admin.ModelAdmin):
     list_display = ['user', 'level', 'xp', 'total_points', 'streak_days', 'completed_videos_count', 'completed_exercises_count', 'last_activity']
+    paginator = NoCountPaginator
+    show_full_result_count = False
     list_filter = ['level', 'last_activity', 'created_at']
     search_fields = ['user__username', 'user__email']
     readonly_fields = ['user', 'last_activity', 'created_at']
-    filter_horizontal = ['completed_videos', 'completed_exercises']
+    raw_id_fields = ['completed_videos', 'completed_exercises']
+    list_select_related = ['user']
+    
+    def get_queryset(self, request):
+        qs = super().get_queryset(request)
+        return qs.annotate(
+            _videos_count=Count('completed_videos', distinct=True),
+            _exercises_count=Count('completed_exercises', distinct=True),
+        )
     
     def completed_videos_count(self, obj):
-        return obj.completed_videos.count()
+        return obj._videos_count
     completed_videos_count.short_description = 'Vidéos Complétées'
+    completed_videos_count.admin_order_field = '_videos_count'
     
     def completed_exercises_count(self, obj):
-        return obj.completed_exercises.count()
+        return obj._exercises_count
     completed_exercises_count.short_description = 'Exercices Complétés'
+    completed_exercises_count.admin_order_field = '_exercises_count'
     
     def has_add_permission(self, request):
         # Progress is created automatically
@@ -178,7 +250,8 @@ class UserCourseProgressAdmin(admin.ModelAdmin):
     list_filter = ['is_started', 'is_completed', 'course', 'last_accessed']
     search_fields = ['user__username', 'course__title']
     readonly_fields = ['started_at', 'completed_at', 'last_accessed', 'completion_percentage']
-    filter_horizontal = ['completed_items']
+    raw_id_fields = ['completed_items', 'current_item', 'course']
+    list_select_related = ['user', 'course', 'current_item']
     
     fieldsets = (
         ('Utilisateur & Cours', {
@@ -222,13 +295,30 @@ class BadgeAdmin(admin.ModelAdmin):
     )
 
 
+class BadgeFilter(admin.SimpleListFilter):
+    """Badge filter populated from the small Badge table, not from UserBadge"""
+    title = 'badge'
+    parameter_name = 'badge'
+    
+    def lookups(self, request, model_admin):
+        return Badge.objects.values_list('id', 'name')
+    
+    def queryset(self, request, queryset):
+        if self.value():
+            return queryset.filter(badge_id=self.value())
+        return queryset
+
+
 @admin.register(UserBadge)
 class UserBadgeAdmin(admin.ModelAdmin):
     list_display = ['user', 'badge', 'unlocked_at']
-    list_filter = ['unlocked_at', 'badge']
+    paginator = NoCountPaginator
+    show_full_result_count = False
+    list_filter = ['unlocked_at', BadgeFilter]
     search_fields = ['user__username', 'badge__name']
     readonly_fields = ['unlocked_at']
     ordering = ['-unlocked_at']
+    list_select_related = ['user', 'badge']
     
     def has_add_permission(self, request):
         # Badges are unlocked automatically
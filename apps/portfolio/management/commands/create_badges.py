@@ -99,24 +99,21 @@ class Command(BaseCommand):
             },
         ]
 
-        created_count = 0
+        names = [badge_data['name'] for badge_data in badges_data]
+        existing = set(Badge.objects.filter(name__in=names).values_list('name', flat=True))
+        new_badges = [Badge(**badge_data) for badge_data in badges_data if badge_data['name'] not in existing]
+        Badge.objects.bulk_create(new_badges, batch_size=500)
+
         for badge_data in badges_data:
-            badge, created = Badge.objects.get_or_create(
-                name=badge_data['name'],
-                defaults=badge_data
-            )
-            if created:
-                created_count += 1
+            if badge_data['name'] in existing:
                 self.stdout.write(
-                    self.style.SUCCESS(f'✅ Created badge: {badge.icon} {badge.name}')
+                    self.style.WARNING(f'⚠️  Badge already exists: {badge_data["icon"]} {badge_data["name"]}')
                 )
             else:
                 self.stdout.write(
-                    self.style.WARNING(f'⚠️  Badge already exists: {badge.icon} {badge.name}')
+                    self.style.SUCCESS(f'✅ Created badge: {badge_data["icon"]} {badge_data["name"]}')
                 )
 
         self.stdout.write(
-            self.style.SUCCESS(f'\n🎉 Done! {created_count} new badges created.')
+            self.style.SUCCESS(f'\n🎉 Done! {len(new_badges)} new badges created.')
         )
-
-
@@ -1,11 +1,35 @@
+import json
+from pathlib import Path
+
 from django.core.management.base import BaseCommand
+from django.db import connection, transaction
+from django.db.models import Count
 from apps.portfolio.models import AcademyVideo, AcademyExercise, Course, CourseItem
 
 
+SEED_FILE = Path(__file__).resolve().parents[2] / 'seed_data' / 'academy.json'
+
+
 class Command(BaseCommand):
     help = 'Populate Academy with sample courses, videos, and exercises'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Supprimer et recréer le contenu même s\'il est déjà présent',
+        )
+
+    @transaction.atomic
     def handle(self, *args, **kwargs):
+        with open(SEED_FILE, encoding='utf-8') as f:
+            seed = json.load(f)
+        
+        expected_slugs = {data['slug'] for data in seed['courses']}
+        if not kwargs['force'] and Course.objects.filter(slug__in=expected_slugs).count() == len(expected_slugs):
+            self.stdout.write(self.style.WARNING('⚠️  Contenu de l\'Academy déjà présent (utilisez --force pour le recréer)'))
+            return
+        
         self.stdout.write(self.style.SUCCESS('🚀 Création du contenu de test pour l\'Academy...'))
         
         # Clear existing data
@@ -17,316 +41,74 @@ class Command(BaseCommand):
         
         # Create Videos
         self.stdout.write('🎥 Création des vidéos...')
-        
-        video1 = AcademyVideo.objects.create(
-            title='Introduction à Python',
-            description='Découvrez les bases de Python : variables, types de données et opérateurs.',
-            video_url='https://www.youtube.com/embed/kqtD5dpn9C8',
-            level='beginner',
-            duration=15,
-            order=1,
-            is_active=True
-        )
-        
-        video2 = AcademyVideo.objects.create(
-            title='Les Fonctions en Python',
-            description='Apprenez à créer et utiliser des fonctions en Python.',
-            video_url='https://www.youtube.com/embed/9Os0o3wzS_I',
-            level='beginner',
-            duration=20,
-            order=2,
-            is_active=True
-        )
-        
-        video3 = AcademyVideo.objects.create(
-            title='Introduction à HTML',
-            description='Découvrez les bases du HTML : balises, structure et sémantique.',
-            video_url='https://www.youtube.com/embed/UB1O30fR-EE',
-            level='beginner',
-            duration=18,
-            order=3,
-            is_active=True
-        )
-        
-        video4 = AcademyVideo.objects.create(
-            title='CSS pour Débutants',
-            description='Apprenez à styliser vos pages web avec CSS.',
-            video_url='https://www.youtube.com/embed/1PnVor36_40',
-            level='beginner',
-            duration=22,
-            order=4,
-            is_active=True
-        )
-        
-        video5 = AcademyVideo.objects.create(
-            title='JavaScript - Les Bases',
-            description='Introduction à JavaScript : variables, conditions et boucles.',
-            video_url='https://www.youtube.com/embed/W6NZfCO5SIk',
-            level='beginner',
-            duration=25,
-            order=5,
-            is_active=True
+        videos = self._id_map(
+            AcademyVideo, 'title',
+            AcademyVideo.objects.bulk_create([AcademyVideo(**data) for data in seed['videos']])
         )
-        
-        self.stdout.write(self.style.SUCCESS(f'✅ {AcademyVideo.objects.count()} vidéos créées'))
+        self.stdout.write(self.style.SUCCESS(f'✅ {len(videos)} vidéos créées'))
         
         # Create Exercises
         self.stdout.write('📝 Création des exercices...')
-        
-        exercise1 = AcademyExercise.objects.create(
-            title='Hello World en Python',
-            description='Votre premier programme Python !',
-            language='python',
-            difficulty='easy',
-            instructions='''Écrivez un programme qui affiche "Hello, World!" dans la console.
-
-Conseils :
-- Utilisez la fonction print()
-- N'oubliez pas les guillemets autour du texte''',
-            starter_code='# Écrivez votre code ici\n',
-            solution_code='print("Hello, World!")',
-            order=1,
-            is_active=True
+        exercises = self._id_map(
+            AcademyExercise, 'title',
+            AcademyExercise.objects.bulk_create([AcademyExercise(**data) for data in seed['exercises']])
         )
-        
-        exercise2 = AcademyExercise.objects.create(
-            title='Variables et Calculs',
-            description='Manipulez des variables et effectuez des calculs simples.',
-            language='python',
-            difficulty='easy',
-            instructions='''Créez deux variables 'a' et 'b' avec les valeurs 10 et 5.
-Calculez et affichez :
-- Leur somme
-- Leur différence
-- Leur produit
-
-Exemple de sortie :
-15
-5
-50''',
-            starter_code='# Créez vos variables ici\na = 10\nb = 5\n\n# Affichez les résultats\n',
-            solution_code='''a = 10
-b = 5
-
-print(a + b)
-print(a - b)
-print(a * b)''',
-            order=2,
-            is_active=True
-        )
-        
-        exercise3 = AcademyExercise.objects.create(
-            title='Fonction Addition',
-            description='Créez votre première fonction Python.',
-            language='python',
-            difficulty='medium',
-            instructions='''Créez une fonction 'addition' qui prend deux paramètres et retourne leur somme.
-Testez la fonction avec les valeurs 15 et 27.
-
-Exemple d'utilisation :
-resultat = addition(15, 27)
-print(resultat)  # Affiche 42''',
-            starter_code='''# Créez votre fonction ici
-def addition(a, b):
-    # Votre code ici
-    pass
-
-# Testez votre fonction
-''',
-            solution_code='''def addition(a, b):
-    return a + b
-
-resultat = addition(15, 27)
-print(resultat)''',
-            order=3,
-            is_active=True
-        )
-        
-        exercise4 = AcademyExercise.objects.create(
-            title='Page HTML Simple',
-            description='Créez votre première page HTML.',
-            language='html',
-            difficulty='easy',
-            instructions='''Créez une page HTML avec :
-- Un titre h1 "Bienvenue sur ma page"
-- Un paragraphe avec un texte de votre choix
-- Une liste non ordonnée avec 3 éléments
-
-Structure de base fournie.''',
-            starter_code='''<!DOCTYPE html>
-<html>
-<head>
-    <title>Ma Page</title>
-</head>
-<body>
-    <!-- Ajoutez votre contenu ici -->
-    
-</body>
-</html>''',
-            solution_code='''<!DOCTYPE html>
-<html>
-<head>
-    <title>Ma Page</title>
-</head>
-<body>
-    <h1>Bienvenue sur ma page</h1>
-    <p>Ceci est mon premier site web !</p>
-    <ul>
-        <li>Premier élément</li>
-        <li>Deuxième élément</li>
-        <li>Troisième élément</li>
-    </ul>
-</body>
-</html>''',
-            order=4,
-            is_active=True
-        )
-        
-        exercise5 = AcademyExercise.objects.create(
-            title='Styliser avec CSS',
-            description='Ajoutez du style à votre page.',
-            language='html',
-            difficulty='medium',
-            instructions='''Créez une page HTML avec un style CSS intégré.
-Ajoutez :
-- Un titre h1 en bleu
-- Un paragraphe avec une couleur de fond grise et du padding
-- Une bordure autour du body''',
-            starter_code='''<!DOCTYPE html>
-<html>
-<head>
-    <title>Page Stylisée</title>
-    <style>
-        /* Ajoutez votre CSS ici */
-        
-    </style>
-</head>
-<body>
-    <h1>Mon titre</h1>
-    <p>Mon paragraphe</p>
-</body>
-</html>''',
-            solution_code='''<!DOCTYPE html>
-<html>
-<head>
-    <title>Page Stylisée</title>
-    <style>
-        body {
-            border: 2px solid #333;
-            padding: 20px;
-        }
-        h1 {
-            color: blue;
-        }
-        p {
-            background-color: #f0f0f0;
-            padding: 15px;
-        }
-    </style>
-</head>
-<body>
-    <h1>Mon titre</h1>
-    <p>Mon paragraphe</p>
-</body>
-</html>''',
-            order=5,
-            is_active=True
-        )
-        
-        exercise6 = AcademyExercise.objects.create(
-            title='Alert JavaScript',
-            description='Affichez une alerte avec JavaScript.',
-            language='javascript',
-            difficulty='easy',
-            instructions='''Écrivez du code JavaScript qui :
-1. Affiche une alerte avec le message "Bienvenue !"
-2. Affiche dans la console "Script chargé"
-
-Utilisez alert() et console.log()''',
-            starter_code='''// Votre code JavaScript ici
-''',
-            solution_code='''alert("Bienvenue !");
-console.log("Script chargé");''',
-            order=6,
-            is_active=True
-        )
-        
-        self.stdout.write(self.style.SUCCESS(f'✅ {AcademyExercise.objects.count()} exercices créés'))
+        self.stdout.write(self.style.SUCCESS(f'✅ {len(exercises)} exercices créés'))
         
         # Create Courses
         self.stdout.write('📚 Création des cours...')
-        
-        # Course 1: Python for Beginners
-        course1 = Course.objects.create(
-            title='Python pour Débutants',
-            slug='python-pour-debutants',
-            description='Apprenez les bases de Python de zéro. Parfait pour les débutants qui veulent maîtriser la programmation.',
-            level='beginner',
-            order=1,
-            is_active=True,
-            is_featured=True,
-            estimated_duration=120
-        )
-        
-        CourseItem.objects.create(course=course1, content_type='video', video=video1, order=1, is_required=True)
-        CourseItem.objects.create(course=course1, content_type='exercise', exercise=exercise1, order=2, is_required=True)
-        CourseItem.objects.create(course=course1, content_type='exercise', exercise=exercise2, order=3, is_required=False)
-        CourseItem.objects.create(course=course1, content_type='video', video=video2, order=4, is_required=True)
-        CourseItem.objects.create(course=course1, content_type='exercise', exercise=exercise3, order=5, is_required=True)
-        
-        # Course 2: Web Development Basics
-        course2 = Course.objects.create(
-            title='Développement Web - Les Bases',
-            slug='developpement-web-les-bases',
-            description='Maîtrisez HTML et CSS pour créer vos premières pages web. Introduction complète au développement front-end.',
-            level='beginner',
-            order=2,
-            is_active=True,
-            is_featured=True,
-            estimated_duration=150
-        )
-        
-        CourseItem.objects.create(course=course2, content_type='video', video=video3, order=1, is_required=True)
-        CourseItem.objects.create(course=course2, content_type='exercise', exercise=exercise4, order=2, is_required=True)
-        CourseItem.objects.create(course=course2, content_type='video', video=video4, order=3, is_required=True)
-        CourseItem.objects.create(course=course2, content_type='exercise', exercise=exercise5, order=4, is_required=True)
-        
-        # Course 3: JavaScript Introduction
-        course3 = Course.objects.create(
-            title='JavaScript - Introduction',
-            slug='javascript-introduction',
-            description='Découvrez JavaScript et rendez vos pages web interactives. Apprenez les fondamentaux du langage.',
-            level='beginner',
-            order=3,
-            is_active=True,
-            is_featured=False,
-            estimated_duration=90
+        courses = self._id_map(Course, 'slug', Course.objects.bulk_create([
+            Course(**{k: v for k, v in data.items() if k != 'items'})
+            for data in seed['courses']
+        ]))
+        
+        # Item types double as the CourseItem FK field names
+        lookups = {'video': videos, 'exercise': exercises}
+        items = CourseItem.objects.bulk_create([
+            CourseItem(
+                course_id=courses[data['slug']],
+                content_type=item['type'],
+                order=item['order'],
+                is_required=item['is_required'],
+                **{f"{item['type']}_id": lookups[item['type']][item['ref']]}
+            )
+            for data in seed['courses']
+            for item in data['items']
+        ], batch_size=500)
+        
+        self.stdout.write(self.style.SUCCESS(f'✅ {len(courses)} cours créés'))
+        
+        # Summary, written in one go
+        course_counts = (
+            Course.objects.annotate(items_count=Count('items'))
+            .order_by('order', '-created_at')
+            .values_list('title', 'items_count')
         )
-        
-        CourseItem.objects.create(course=course3, content_type='video', video=video5, order=1, is_required=True)
-        CourseItem.objects.create(course=course3, content_type='exercise', exercise=exercise6, order=2, is_required=True)
-        
-        self.stdout.write(self.style.SUCCESS(f'✅ {Course.objects.count()} cours créés'))
-        
-        # Summary
-        self.stdout.write('')
-        self.stdout.write(self.style.SUCCESS('=' * 60))
-        self.stdout.write(self.style.SUCCESS('🎉 CRÉATION TERMINÉE AVEC SUCCÈS !'))
-        self.stdout.write(self.style.SUCCESS('=' * 60))
-        self.stdout.write('')
-        self.stdout.write(f'📊 Résumé :')
-        self.stdout.write(f'   • Vidéos      : {AcademyVideo.objects.count()}')
-        self.stdout.write(f'   • Exercices   : {AcademyExercise.objects.count()}')
-        self.stdout.write(f'   • Cours       : {Course.objects.count()}')
-        self.stdout.write(f'   • Items Cours : {CourseItem.objects.count()}')
-        self.stdout.write('')
-        self.stdout.write('📚 Cours créés :')
-        for course in Course.objects.all():
-            items_count = course.items.count()
-            self.stdout.write(f'   • {course.title} ({items_count} items)')
-        self.stdout.write('')
-        self.stdout.write('🚀 Testez maintenant :')
-        self.stdout.write('   • http://localhost:3000/academy')
-        self.stdout.write('   • http://localhost:3000/admin/academy')
-        self.stdout.write('')
-
+        banner = '=' * 60
+        lines = [
+            '',
+            self.style.SUCCESS(f'{banner}\n🎉 CRÉATION TERMINÉE AVEC SUCCÈS !\n{banner}'),
+            '',
+            '📊 Résumé :',
+            f'   • Vidéos      : {len(videos)}',
+            f'   • Exercices   : {len(exercises)}',
+            f'   • Cours       : {len(courses)}',
+            f'   • Items Cours : {len(items)}',
+            '',
+            '📚 Cours créés :',
+            *(f'   • {title} ({items_count} items)' for title, items_count in course_counts),
+            '',
+            '🚀 Testez maintenant :',
+            '   • http://localhost:3000/academy',
+            '   • http://localhost:3000/admin/academy',
+            '',
+        ]
+        self.stdout.write('\n'.join(lines) + '\n')
+    
+    def _id_map(self, model, key, created):
+        """Map `key` to the primary key of freshly bulk-created rows."""
+        if connection.features.can_return_rows_from_bulk_insert:
+            return {getattr(obj, key): obj.pk for obj in created}
+        # MySQL does not return primary keys from bulk_create(); the table was
+        # just emptied, so every remaining row is one of ours
+        return dict(model.objects.values_list(key, 'id'))
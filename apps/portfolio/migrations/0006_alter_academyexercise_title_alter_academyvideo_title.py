@@ -0,0 +1,23 @@
+# Generated by Django 5.2.7 on 2026-10-15 22:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0005_badge_course_userprogress_last_activity_date_and_more'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='academyexercise',
+            name='title',
+            field=models.CharField(db_index=True, max_length=200),
+        ),
+        migrations.AlterField(
+            model_name='academyvideo',
+            name='title',
+            field=models.CharField(db_index=True, max_length=200),
+        ),
+    ]
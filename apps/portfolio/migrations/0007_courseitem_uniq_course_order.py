@@ -0,0 +1,21 @@
+# Generated by Django 5.2.7 on 2026-10-15 22:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('portfolio', '0006_alter_academyexercise_title_alter_academyvideo_title'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='courseitem',
+            constraint=models.UniqueConstraint(fields=('course', 'order'), name='uniq_course_order'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='courseitem',
+            unique_together=set(),
+        ),
+    ]
@@ -1,11 +1,56 @@
 import os
+import shutil
+import subprocess
+from bisect import bisect_right
 from io import BytesIO
 from PIL import Image
 
 from django.db import models
 from django.contrib.auth.models import User
 from django.utils import timezone
-from django.core.files.base import ContentFile
+from django.core.cache import cache
+from django.core.files.base import File
+
+# The SiteConfig cache lives in the default cache. No CACHES setting is
+# defined, so that is a per-process LocMemCache: deleting a key only affects
+# the process that deletes it, and edits made elsewhere (shell, other workers)
+# are only picked up once the timeout expires.
+
+# Singleton SiteConfig row, invalidated on save/delete in this process; other
+# workers pick up admin edits within the timeout
+SITE_CONFIG_CACHE_KEY = 'siteconfig:solo'
+SITE_CONFIG_CACHE_TIMEOUT = 60
+
+# get_FOO_display() rebuilds a dict from the field choices on every call, so
+# models whose labels are serialized keep a class-level _FOO_DISPLAY dict and
+# expose it through a FOO_display property
+
+# Level thresholds: 0-100: lvl 1, 100-300: lvl 2, 300-700: lvl 3, etc.
+LEVEL_THRESHOLDS = (0, 100, 300, 700, 1500, 3000, 6000, 10000)
+
+
+# Optional palette quantiser for PNG uploads, used when installed on the host
+PNGQUANT = shutil.which('pngquant')
+
+
+def _quantize_png(img):
+    """PNG bytes quantised by pngquant, or None when unavailable or rejected"""
+    if not PNGQUANT:
+        return None
+    # pngquant re-encodes anyway, so hand it a fast zlib encode
+    raw = BytesIO()
+    img.save(raw, format='PNG', compress_level=1)
+    try:
+        result = subprocess.run(
+            [PNGQUANT, '--quality=65-85', '--speed', '3', '-'],
+            input=raw.getvalue(), capture_output=True, timeout=30
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    # Exit code 99: the quality floor could not be met, keep lossless PNG
+    if result.returncode != 0:
+        return None
+    return BytesIO(result.stdout)
 
 
 class Post(models.Model):
@@ -37,7 +82,8 @@ class Post(models.Model):
             ext = os.path.splitext(self.media.name)[1].lower()
             if ext in ['.jpg', '.jpeg', '.png', '.gif']:
                 self.media_type = 'image'
-                if ext != '.gif':
+                # Only fresh uploads; stored files were compressed when uploaded
+                if ext != '.gif' and not self.media._committed:
                     self.media = self.compress_image(self.media)
         elif self.video_url:
             self.media_type = 'video'
@@ -50,6 +96,7 @@ class Post(models.Model):
             img = Image.open(uploaded_file)
 
             max_size = (1600, 1600)
+            # thumbnail() already lets libjpeg decode at a reduced scale (draft)
             img.thumbnail(max_size, Image.LANCZOS)
 
             buffer = BytesIO()
@@ -57,16 +104,23 @@ class Post(models.Model):
             if ext in ['.jpg', '.jpeg']:
                 if img.mode in ('RGBA', 'P'):
                     img = img.convert('RGB')
-                img.save(buffer, format='JPEG', quality=75, optimize=True)
+                # Progressive scans render early on slow links and always get
+                # optimized Huffman tables, so optimize=True is redundant
+                img.save(buffer, format='JPEG', quality=75, progressive=True, subsampling='4:2:0')
                 new_name = os.path.splitext(uploaded_file.name)[0] + '.jpg'
             elif ext == '.png':
-                img.save(buffer, format='PNG', optimize=True)
+                quantized = _quantize_png(img)
+                if quantized is not None:
+                    buffer = quantized
+                else:
+                    img.save(buffer, format='PNG', optimize=True)
                 new_name = uploaded_file.name
             else:
                 return uploaded_file
 
             buffer.seek(0)
-            return ContentFile(buffer.getvalue(), name=new_name)
+            # Hand the buffer over as-is rather than copying its bytes out
+            return File(buffer, name=new_name)
         except Exception:
             return uploaded_file
 
@@ -127,9 +181,21 @@ class SiteConfig(models.Model):
     def __str__(self):
         return "Site Configuration"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        cache.delete(SITE_CONFIG_CACHE_KEY)
+
+    def delete(self, *args, **kwargs):
+        result = super().delete(*args, **kwargs)
+        cache.delete(SITE_CONFIG_CACHE_KEY)
+        return result
+
     @classmethod
     def get_solo(cls):
-        obj, _ = cls.objects.get_or_create(pk=1)
+        obj = cache.get(SITE_CONFIG_CACHE_KEY)
+        if obj is None:
+            obj, _ = cls.objects.get_or_create(pk=1)
+            cache.set(SITE_CONFIG_CACHE_KEY, obj, SITE_CONFIG_CACHE_TIMEOUT)
         return obj
 
 
@@ -140,6 +206,7 @@ class Course(models.Model):
         ('intermediate', 'Intermédiaire'),
         ('advanced', 'Avancé'),
     ]
+    _LEVEL_DISPLAY = dict(LEVEL_CHOICES)
     
     title = models.CharField(max_length=200)
     slug = models.SlugField(unique=True, blank=True)
@@ -163,6 +230,10 @@ class Course(models.Model):
     
     def __str__(self):
         return self.title
+
+    @property
+    def level_display(self):
+        return self._LEVEL_DISPLAY.get(self.level, self.level)
     
     def save(self, *args, **kwargs):
         if not self.slug:
@@ -189,8 +260,9 @@ class AcademyVideo(models.Model):
         ('intermediate', 'Intermédiaire'),
         ('advanced', 'Avancé'),
     ]
+    _LEVEL_DISPLAY = dict(LEVEL_CHOICES)
     
-    title = models.CharField(max_length=200)
+    title = models.CharField(max_length=200, db_index=True)
     description = models.TextField()
     video_url = models.URLField(help_text="YouTube or Vimeo URL")
     thumbnail = models.ImageField(upload_to='academy/thumbnails/', blank=True, null=True)
@@ -209,6 +281,10 @@ class AcademyVideo(models.Model):
     def __str__(self):
         return f"{self.title} ({self.get_level_display()})"
 
+    @property
+    def level_display(self):
+        return self._LEVEL_DISPLAY.get(self.level, self.level)
+
 
 class AcademyExercise(models.Model):
     DIFFICULTY_CHOICES = [
@@ -226,8 +302,10 @@ class AcademyExercise(models.Model):
         ('html', 'HTML/CSS'),
         ('other', 'Autre'),
     ]
+    _DIFFICULTY_DISPLAY = dict(DIFFICULTY_CHOICES)
+    _LANGUAGE_DISPLAY = dict(LANGUAGE_CHOICES)
     
-    title = models.CharField(max_length=200)
+    title = models.CharField(max_length=200, db_index=True)
     description = models.TextField()
     language = models.CharField(max_length=20, choices=LANGUAGE_CHOICES)
     difficulty = models.CharField(max_length=20, choices=DIFFICULTY_CHOICES, default='easy')
@@ -252,6 +330,14 @@ class AcademyExercise(models.Model):
     def __str__(self):
         return f"{self.title} ({self.get_language_display()} - {self.get_difficulty_display()})"
 
+    @property
+    def difficulty_display(self):
+        return self._DIFFICULTY_DISPLAY.get(self.difficulty, self.difficulty)
+
+    @property
+    def language_display(self):
+        return self._LANGUAGE_DISPLAY.get(self.language, self.language)
+
 
 class CourseItem(models.Model):
     """Links videos and exercises to courses in a specific order"""
@@ -275,7 +361,9 @@ class CourseItem(models.Model):
     
     class Meta:
         ordering = ['course', 'order']
-        unique_together = ['course', 'order']
+        constraints = [
+            models.UniqueConstraint(fields=['course', 'order'], name='uniq_course_order'),
+        ]
         verbose_name = 'Course Item'
         verbose_name_plural = 'Course Items'
     
@@ -292,19 +380,22 @@ class CourseItem(models.Model):
             return self.video
         return self.exercise
     
+    # Navigation only needs these, keep the neighbour lookups narrow
+    NAVIGATION_FIELDS = ('id', 'course_id', 'order', 'content_type', 'video_id', 'exercise_id')
+    
     def get_next_item(self):
         """Get the next item in the course"""
         return CourseItem.objects.filter(
-            course=self.course,
+            course_id=self.course_id,
             order__gt=self.order
-        ).order_by('order').first()
+        ).only(*self.NAVIGATION_FIELDS).order_by('order').first()
     
     def get_previous_item(self):
         """Get the previous item in the course"""
         return CourseItem.objects.filter(
-            course=self.course,
+            course_id=self.course_id,
             order__lt=self.order
-        ).order_by('-order').first()
+        ).only(*self.NAVIGATION_FIELDS).order_by('-order').first()
 
 
 class UserProgress(models.Model):
@@ -339,13 +430,11 @@ class UserProgress(models.Model):
         self.xp += points
         self.total_points += points
         
-        # Level thresholds: 0-100: lvl 1, 100-300: lvl 2, 300-700: lvl 3, etc.
-        level_thresholds = [0, 100, 300, 700, 1500, 3000, 6000, 10000]
-        for level, threshold in enumerate(level_thresholds, start=1):
-            if self.xp >= threshold:
-                self.level = level
+        # Number of thresholds reached is the level
+        self.level = bisect_right(LEVEL_THRESHOLDS, self.xp)
         
-        self.save()
+        # last_activity is auto_now, but only written when listed
+        self.save(update_fields=['xp', 'total_points', 'level', 'last_activity'])
         return self.level
     
     def check_streak(self):
@@ -366,7 +455,7 @@ class UserProgress(models.Model):
             self.streak_days = 1
         
         self.last_activity_date = today
-        self.save()
+        self.save(update_fields=['streak_days', 'last_activity_date', 'last_activity'])
 
 
 class Badge(models.Model):
@@ -443,9 +532,10 @@ class UserCourseProgress(models.Model):
     def __str__(self):
         return f"{self.user.username} - {self.course.title} ({self.completion_percentage}%)"
     
-    def calculate_progress(self):
+    def calculate_progress(self, total_items=None):
         """Calculate and update completion percentage"""
-        total_items = self.course.get_total_items()
+        if total_items is None:
+            total_items = self.course.get_total_items()
         if total_items == 0:
             self.completion_percentage = 0
         else:
@@ -458,6 +548,6 @@ class UserCourseProgress(models.Model):
                 from django.utils import timezone
                 self.completed_at = timezone.now()
         
-        self.save()
+        self.save(update_fields=['completion_percentage', 'is_completed', 'completed_at', 'last_accessed'])
         return self.completion_percentage
 
@@ -0,0 +1,89 @@
+"""
+Shared helpers for the Academy wipe-and-rebuild management commands
+"""
+from django.db import connection
+from django.utils.text import slugify
+from apps.portfolio.models import (
+    Course, AcademyVideo, AcademyExercise, CourseItem,
+    UserProgress, UserCourseProgress
+)
+
+
+# Academy tables wiped before a rebuild, dependants first. The M2M join
+# tables are listed too since raw DELETEs do not cascade through them.
+PROGRESS_MODELS = (
+    UserCourseProgress.completed_items.through,
+    UserProgress.completed_videos.through,
+    UserProgress.completed_exercises.through,
+    UserCourseProgress,
+    UserProgress,
+)
+ACADEMY_MODELS = PROGRESS_MODELS + (CourseItem, Course, AcademyExercise, AcademyVideo)
+
+
+def delete_all():
+    """Delete all existing Academy data"""
+    # Raw DELETEs skip the deletion collector and signals, nothing listens here
+    for model in ACADEMY_MODELS:
+        model.objects.all()._raw_delete(connection.alias)
+
+
+def create_videos(videos_data):
+    """Insert videos and return them with their primary keys"""
+    AcademyVideo.objects.bulk_create(
+        [AcademyVideo(**data) for data in videos_data], batch_size=100
+    )
+    # bulk_create() does not return primary keys on MySQL, re-fetch the rows
+    return list(AcademyVideo.objects.filter(title__in=[data['title'] for data in videos_data]))
+
+
+def create_exercises(exercises_data):
+    """Insert exercises and return them with their primary keys"""
+    AcademyExercise.objects.bulk_create(
+        [AcademyExercise(**data) for data in exercises_data], batch_size=100
+    )
+    # bulk_create() does not return primary keys on MySQL, re-fetch the rows
+    return list(AcademyExercise.objects.filter(title__in=[data['title'] for data in exercises_data]))
+
+
+def create_courses(courses_data, videos, exercises):
+    """Insert courses and their items, referenced by video/exercise title"""
+    # Item types double as the CourseItem FK field names
+    lookups = {
+        'video': {v.title: v for v in videos},
+        'exercise': {e.title: e for e in exercises},
+    }
+
+    # Insert every course in one query; bulk_create() skips save(), so set
+    # the slug here and re-fetch the rows since MySQL returns no primary keys
+    Course.objects.bulk_create(
+        [
+            Course(
+                slug=slugify(course_data['title']),
+                **{k: v for k, v in course_data.items() if k != 'items'}
+            )
+            for course_data in courses_data
+        ],
+        batch_size=50
+    )
+    course_dict = {
+        c.title: c
+        for c in Course.objects.filter(title__in=[data['title'] for data in courses_data])
+    }
+    courses = [course_dict[course_data['title']] for course_data in courses_data]
+
+    items = []
+    for course, course_data in zip(courses, courses_data):
+        items.extend(
+            CourseItem(
+                course=course,
+                content_type=item_data['type'],
+                order=idx,
+                **{item_data['type']: lookups[item_data['type']][item_data['title']]}
+            )
+            for idx, item_data in enumerate(course_data['items'])
+        )
+
+    CourseItem.objects.bulk_create(items, batch_size=500)
+
+    return courses
@@ -37,9 +37,20 @@ class CommentSerializer(serializers.ModelSerializer):
         return super().create(validated_data)
 
 
+class CommentReadSerializer(serializers.ModelSerializer):
+    """Read-only comment rendering for the nested post detail list"""
+    author = UserSerializer(read_only=True)
+
+    class Meta:
+        model = Comment
+        fields = ['id', 'post', 'author', 'content', 'created_at', 'is_approved']
+        read_only_fields = fields
+
+
 class PostListSerializer(serializers.ModelSerializer):
     author = UserSerializer(read_only=True)
-    comments_count = serializers.SerializerMethodField()
+    # Annotated by PostViewSet.get_queryset(); a freshly created post has none
+    comments_count = serializers.IntegerField(read_only=True, default=0)
     
     class Meta:
         model = Post
@@ -49,9 +60,6 @@ class PostListSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at', 'author']
 
-    def get_comments_count(self, obj):
-        return obj.comments.filter(is_approved=True).count()
-
     def create(self, validated_data):
         validated_data['author'] = self.context['request'].user
         return super().create(validated_data)
@@ -59,8 +67,9 @@ class PostListSerializer(serializers.ModelSerializer):
 
 class PostDetailSerializer(serializers.ModelSerializer):
     author = UserSerializer(read_only=True)
-    comments = CommentSerializer(many=True, read_only=True)
-    comments_count = serializers.SerializerMethodField()
+    comments = CommentReadSerializer(many=True, read_only=True)
+    # Annotated by PostViewSet.get_queryset(); a freshly created post has none
+    comments_count = serializers.IntegerField(read_only=True, default=0)
     
     class Meta:
         model = Post
@@ -71,9 +80,6 @@ class PostDetailSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at', 'author']
 
-    def get_comments_count(self, obj):
-        return obj.comments.filter(is_approved=True).count()
-
     def create(self, validated_data):
         validated_data['author'] = self.context['request'].user
         return super().create(validated_data)
@@ -91,7 +97,7 @@ class SiteConfigSerializer(serializers.ModelSerializer):
 
 
 class AcademyVideoSerializer(serializers.ModelSerializer):
-    level_display = serializers.CharField(source='get_level_display', read_only=True)
+    level_display = serializers.CharField(read_only=True)
     
     class Meta:
         model = AcademyVideo
@@ -103,8 +109,8 @@ class AcademyVideoSerializer(serializers.ModelSerializer):
 
 
 class AcademyExerciseSerializer(serializers.ModelSerializer):
-    difficulty_display = serializers.CharField(source='get_difficulty_display', read_only=True)
-    language_display = serializers.CharField(source='get_language_display', read_only=True)
+    difficulty_display = serializers.CharField(read_only=True)
+    language_display = serializers.CharField(read_only=True)
     is_completed = serializers.SerializerMethodField()
     
     class Meta:
@@ -119,6 +125,10 @@ class AcademyExerciseSerializer(serializers.ModelSerializer):
     def get_is_completed(self, obj):
         request = self.context.get('request')
         if request and request.user.is_authenticated:
+            # Preloaded by the view for list/detail responses
+            completed_ids = self.context.get('completed_exercise_ids')
+            if completed_ids is not None:
+                return obj.id in completed_ids
             return obj.completed_by.filter(user=request.user).exists()
         return False
 
@@ -130,8 +140,9 @@ class ExerciseSubmissionSerializer(serializers.Serializer):
     
 class UserProgressSerializer(serializers.ModelSerializer):
     user = UserSerializer(read_only=True)
-    completed_videos_count = serializers.SerializerMethodField()
-    completed_exercises_count = serializers.SerializerMethodField()
+    # Annotated by UserProgressViewSet.get_queryset(); a new row has none
+    completed_videos_count = serializers.IntegerField(read_only=True, default=0)
+    completed_exercises_count = serializers.IntegerField(read_only=True, default=0)
     
     class Meta:
         model = UserProgress
@@ -140,16 +151,18 @@ class UserProgressSerializer(serializers.ModelSerializer):
             'total_points', 'streak_days', 'last_activity', 'created_at'
         ]
         read_only_fields = ['id', 'user', 'last_activity', 'created_at']
-    
-    def get_completed_videos_count(self, obj):
-        return obj.completed_videos.count()
-    
-    def get_completed_exercises_count(self, obj):
-        return obj.completed_exercises.count()
 
 
 # ===== COURSE SERIALIZERS =====
 
+def _get_course_progress(user, course):
+    """Progress prefetched by the view into _my_progress, else a single lookup"""
+    prefetched = getattr(course, '_my_progress', None)
+    if prefetched is not None:
+        return prefetched[0] if prefetched else None
+    return UserCourseProgress.objects.filter(user=user, course=course).select_related('current_item').first()
+
+
 class CourseItemWriteSerializer(serializers.ModelSerializer):
     """Serializer for creating/updating course items"""
     
@@ -177,41 +190,37 @@ class CourseItemWriteSerializer(serializers.ModelSerializer):
 
 class CourseItemDetailSerializer(serializers.ModelSerializer):
     """Detailed serializer for course items including actual content"""
-    content_title = serializers.SerializerMethodField()
-    content_description = serializers.SerializerMethodField()
-    content_data = serializers.SerializerMethodField()
     
     class Meta:
         model = CourseItem
         fields = [
-            'id', 'course', 'order', 'content_type', 'video', 'exercise', 'is_required',
-            'content_title', 'content_description', 'content_data'
+            'id', 'course', 'order', 'content_type', 'video', 'exercise', 'is_required'
         ]
-        read_only_fields = ['content_title', 'content_description', 'content_data']
-    
-    def get_content_title(self, obj):
-        content = obj.get_content()
-        return content.title if content else None
     
-    def get_content_description(self, obj):
+    def to_representation(self, obj):
+        """Add content_title, content_description and content_data from one get_content()"""
+        data = super().to_representation(obj)
         content = obj.get_content()
-        return content.description if content else None
-    
-    def get_content_data(self, obj):
-        """Return the full serialized content (video or exercise)"""
-        if obj.content_type == 'video' and obj.video:
-            return AcademyVideoSerializer(obj.video).data
-        elif obj.content_type == 'exercise' and obj.exercise:
-            return AcademyExerciseSerializer(obj.exercise, context=self.context).data
-        return None
+        data['content_title'] = content.title if content else None
+        data['content_description'] = content.description if content else None
+        
+        # Full serialized content (video or exercise)
+        if content is None:
+            data['content_data'] = None
+        elif obj.content_type == 'video':
+            data['content_data'] = AcademyVideoSerializer(content).data
+        else:
+            data['content_data'] = AcademyExerciseSerializer(content, context=self.context).data
+        return data
 
 
 class CourseListSerializer(serializers.ModelSerializer):
     """Serializer for listing courses"""
-    level_display = serializers.CharField(source='get_level_display', read_only=True)
-    items_count = serializers.SerializerMethodField()
-    videos_count = serializers.IntegerField(source='get_videos_count', read_only=True)
-    exercises_count = serializers.IntegerField(source='get_exercises_count', read_only=True)
+    level_display = serializers.CharField(read_only=True)
+    # Annotated by CourseViewSet.get_queryset(); a freshly created course has none
+    items_count = serializers.IntegerField(read_only=True, default=0)
+    videos_count = serializers.IntegerField(read_only=True, default=0)
+    exercises_count = serializers.IntegerField(read_only=True, default=0)
     user_progress = serializers.SerializerMethodField()
     
     class Meta:
@@ -224,33 +233,39 @@ class CourseListSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
     
-    def get_items_count(self, obj):
-        return obj.get_total_items()
-    
     def get_user_progress(self, obj):
         """Get user's progress for this course"""
         request = self.context.get('request')
         if request and request.user.is_authenticated:
-            try:
-                progress = UserCourseProgress.objects.get(user=request.user, course=obj)
+            if hasattr(obj, '_progress_started'):
+                # Subquery annotations from CourseViewSet; None when not started
+                if obj._progress_started is None:
+                    return None
+                return {
+                    'is_started': obj._progress_started,
+                    'is_completed': obj._progress_completed,
+                    'completion_percentage': obj._progress_pct,
+                    'current_item_order': obj._current_item_order
+                }
+            progress = _get_course_progress(request.user, obj)
+            if progress:
                 return {
                     'is_started': progress.is_started,
                     'is_completed': progress.is_completed,
                     'completion_percentage': progress.completion_percentage,
                     'current_item_order': progress.current_item.order if progress.current_item else None
                 }
-            except UserCourseProgress.DoesNotExist:
-                pass
         return None
 
 
 class CourseDetailSerializer(serializers.ModelSerializer):
     """Detailed serializer for a single course including all items"""
-    level_display = serializers.CharField(source='get_level_display', read_only=True)
+    level_display = serializers.CharField(read_only=True)
     items = CourseItemDetailSerializer(many=True, read_only=True)
-    items_count = serializers.SerializerMethodField()
-    videos_count = serializers.IntegerField(source='get_videos_count', read_only=True)
-    exercises_count = serializers.IntegerField(source='get_exercises_count', read_only=True)
+    # Annotated by CourseViewSet.get_queryset(); a freshly created course has none
+    items_count = serializers.IntegerField(read_only=True, default=0)
+    videos_count = serializers.IntegerField(read_only=True, default=0)
+    exercises_count = serializers.IntegerField(read_only=True, default=0)
     user_progress = serializers.SerializerMethodField()
     
     class Meta:
@@ -263,15 +278,12 @@ class CourseDetailSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
     
-    def get_items_count(self, obj):
-        return obj.get_total_items()
-    
     def get_user_progress(self, obj):
         """Get user's progress for this course"""
         request = self.context.get('request')
         if request and request.user.is_authenticated:
-            try:
-                progress = UserCourseProgress.objects.get(user=request.user, course=obj)
+            progress = _get_course_progress(request.user, obj)
+            if progress:
                 return {
                     'is_started': progress.is_started,
                     'is_completed': progress.is_completed,
@@ -280,8 +292,6 @@ class CourseDetailSerializer(serializers.ModelSerializer):
                     'current_item_order': progress.current_item.order if progress.current_item else None,
                     'completed_items_ids': list(progress.completed_items.values_list('id', flat=True))
                 }
-            except UserCourseProgress.DoesNotExist:
-                pass
         return None
 
 
@@ -2,9 +2,27 @@
 Google Gemini AI Service for Intelligent Code Correction
 """
 import os
+import re
 import json
+import hashlib
+import threading
 from typing import Dict, Any, Optional
 from django.conf import settings
+from django.core.cache import cache
+
+try:
+    import requests
+except ImportError:
+    requests = None
+
+
+# Raw Gemini responses keyed by SHA-256 of model + prompt
+EVALUATION_CACHE_KEY = 'gemini:evaluation:{}'
+
+# Patterns used to dig the evaluation JSON out of the model's text
+_MD_JSON_RE = re.compile(r'```(?:json|JSON)?\s*(\{.*?\})\s*```', re.DOTALL)
+_IS_CORRECT_RE = re.compile(r'\{[^}]*"is_correct"[^}]*\}', re.DOTALL)
+_FEEDBACK_RE = re.compile(r'"feedback"\s*:\s*"([^"]+)"')
 
 
 class GeminiService:
@@ -22,12 +40,26 @@ class GeminiService:
         # Updated to use the latest Gemini model (gemini-2.5-flash is fast and accurate)
         self.model = "gemini-2.5-flash"
         self.base_url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model}:generateContent"
+        # Low-temperature evaluations are repeatable enough to reuse for identical prompts
+        self.cache_enabled = getattr(settings, 'GEMINI_CACHE_ENABLED', True)
+        self.cache_timeout = getattr(settings, 'GEMINI_CACHE_TIMEOUT', 86400)
+        # requests.Session is not documented as thread-safe and gunicorn runs
+        # several threads per worker, so each thread keeps its own session
+        self._local = threading.local()
         
         if not self.api_key:
             print("⚠️ Warning: GEMINI_API_KEY not set. AI correction disabled.")
         else:
             print(f"✅ Gemini AI enabled ({self.model}) with API key: {self.api_key[:20]}...")
     
+    @property
+    def session(self):
+        """Keep-alive session reused across evaluations, one per thread"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        return session
+    
     def is_available(self) -> bool:
         """Check if Gemini API is available"""
         return bool(self.api_key)
@@ -38,7 +70,8 @@ class GeminiService:
         solution_code: str,
         language: str,
         instructions: str,
-        execution_output: Optional[str] = None
+        execution_output: Optional[str] = None,
+        no_cache: bool = False
     ) -> Dict[str, Any]:
         """
         Use Gemini AI to intelligently evaluate submitted code
@@ -49,6 +82,7 @@ class GeminiService:
             language: Programming language (python, java, cpp, etc.)
             instructions: Exercise instructions
             execution_output: Output from Judge0 execution (if available)
+            no_cache: Always call the API, even for a previously seen prompt
         
         Returns:
             Dict with evaluation results:
@@ -65,7 +99,8 @@ class GeminiService:
             return self._basic_validation(submitted_code, solution_code, execution_output)
         
         try:
-            import requests
+            # Resubmissions that only differ by trailing whitespace share a prompt
+            submitted_code = '\n'.join(line.rstrip() for line in submitted_code.strip('\n').splitlines())
             
             # Build the prompt for Gemini
             prompt = self._build_evaluation_prompt(
@@ -76,6 +111,15 @@ class GeminiService:
                 execution_output
             )
             
+            # Identical submissions reuse the earlier Gemini answer
+            cache_key = None
+            if self.cache_enabled and not no_cache:
+                digest = hashlib.sha256(f"{self.model}|{prompt}".encode()).hexdigest()
+                cache_key = EVALUATION_CACHE_KEY.format(digest)
+                cached = cache.get(cache_key)
+                if cached is not None:
+                    return self._parse_gemini_response(cached)
+            
             # Call Gemini API
             headers = {
                 'Content-Type': 'application/json',
@@ -97,13 +141,15 @@ class GeminiService:
             }
             
             url = f"{self.base_url}?key={self.api_key}"
-            response = requests.post(url, headers=headers, json=payload, timeout=30)
+            response = self.session.post(url, headers=headers, json=payload, timeout=(5, 30))
             
             if response.status_code != 200:
                 print(f"Gemini API error: {response.status_code} - {response.text}")
                 return self._basic_validation(submitted_code, solution_code, execution_output)
             
             result = response.json()
+            if cache_key:
+                cache.set(cache_key, result, self.cache_timeout)
             
             # Parse Gemini response
             return self._parse_gemini_response(result)
@@ -193,9 +239,8 @@ Return ONLY the JSON object above. Do not wrap it in code blocks or add any othe
                     text = text.strip()
                     
                     # More aggressive cleaning of markdown blocks
-                    import re
                     # Extract JSON from markdown code blocks
-                    json_match = re.search(r'```(?:json|JSON)?\s*(\{.*?\})\s*```', text, re.DOTALL)
+                    json_match = _MD_JSON_RE.search(text)
                     if json_match:
                         text = json_match.group(1)
                     elif text.startswith('```'):
@@ -203,7 +248,7 @@ Return ONLY the JSON object above. Do not wrap it in code blocks or add any othe
                         text = text.replace('```json', '').replace('```JSON', '').replace('```', '').strip()
                     
                     # Try to extract just the JSON object if there's extra text
-                    json_match = re.search(r'\{[^}]*"is_correct"[^}]*\}', text, re.DOTALL)
+                    json_match = _IS_CORRECT_RE.search(text)
                     if json_match:
                         text = json_match.group(0)
                     
@@ -227,7 +272,7 @@ Return ONLY the JSON object above. Do not wrap it in code blocks or add any othe
                         is_correct = 'correct' in text.lower() and 'incorrect' not in text.lower()
                         
                         # Try to extract feedback from the text
-                        feedback_match = re.search(r'"feedback"\s*:\s*"([^"]+)"', text)
+                        feedback_match = _FEEDBACK_RE.search(text)
                         feedback = feedback_match.group(1) if feedback_match else text[:200]
                         
                         return {
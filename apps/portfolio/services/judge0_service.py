@@ -1,6 +1,7 @@
 """
 Judge0 API Service for executing code in multiple languages
 """
+import threading
 import time
 from typing import Dict, Any, Optional
 
@@ -14,6 +15,12 @@ except ImportError:
 # Judge0 Community Free Endpoint
 JUDGE0_FREE_URL = "https://ce.judge0.com"
 
+# Result polling backs off from 50ms to 1s, about 15s in total over 20 attempts
+POLL_INITIAL_DELAY = 0.05
+POLL_BACKOFF = 1.7
+POLL_MAX_DELAY = 1.0
+POLL_MAX_ATTEMPTS = 20
+
 # Language ID mapping (Judge0 language IDs)
 LANGUAGE_IDS = {
     'python': 71,      # Python 3.8.1
@@ -39,9 +46,23 @@ class Judge0Service:
             "Content-Type": "application/json"
         }
         
+        # requests.Session is not documented as thread-safe and gunicorn runs
+        # several threads per worker, so each thread keeps its own session
+        self._local = threading.local()
+        
         if requests is None:
             print("⚠️ Warning: requests module not available. Judge0 execution disabled.")
     
+    @property
+    def session(self):
+        """Keep-alive session for submissions and polling, one per thread"""
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(self.headers)
+            self._local.session = session
+        return session
+    
     def is_available(self) -> bool:
         """Check if Judge0 service is available"""
         return requests is not None
@@ -106,12 +127,11 @@ class Judge0Service:
             
             # Submit code
             try:
-                response = requests.post(
+                response = self.session.post(
                     f"{self.base_url}/submissions",
                     params={"base64_encoded": "false", "wait": "false"},
                     json=submission_data,
-                    headers=self.headers,
-                    timeout=15
+                    timeout=(5, 15)
                 )
             except requests.exceptions.Timeout:
                 return {
@@ -161,7 +181,7 @@ class Judge0Service:
                 'message': f'❌ Unexpected error: {str(e)[:100]}'
             }
     
-    def _wait_for_result(self, token: str, max_attempts: int = 10) -> Dict[str, Any]:
+    def _wait_for_result(self, token: str, max_attempts: int = POLL_MAX_ATTEMPTS) -> Dict[str, Any]:
         """
         Poll Judge0 API for submission result
         
@@ -172,17 +192,21 @@ class Judge0Service:
         Returns:
             Dict with execution results
         """
+        delay = POLL_INITIAL_DELAY
         for attempt in range(max_attempts):
+            if attempt:
+                # Fast programs finish within the first few short waits
+                time.sleep(delay)
+                delay = min(delay * POLL_BACKOFF, POLL_MAX_DELAY)
+            
             try:
-                response = requests.get(
+                response = self.session.get(
                     f"{self.base_url}/submissions/{token}",
                     params={"base64_encoded": "false"},
-                    headers=self.headers,
-                    timeout=10
+                    timeout=(5, 10)
                 )
                 
                 if response.status_code != 200:
-                    time.sleep(1)
                     continue
                 
                 result = response.json()
@@ -198,14 +222,12 @@ class Judge0Service:
                 # 7-14: Various runtime errors
                 
                 if status_id in [1, 2]:  # Still processing
-                    time.sleep(1)
                     continue
                 
                 # Process completed
                 return self._format_result(result)
                 
             except requests.RequestException:
-                time.sleep(1)
                 continue
         
         return {
@@ -1,7 +1,7 @@
 from rest_framework import viewsets, permissions, status, filters
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.db.models import Q
+from django.db.models import Count, OuterRef, Prefetch, Q, Subquery
 from django.utils import timezone
 from .models import (
     Post, Comment, Profile, SiteConfig, 
@@ -44,7 +44,18 @@ class PostViewSet(viewsets.ModelViewSet):
         serializer.save(author=self.request.user)
 
     def get_queryset(self):
-        queryset = Post.objects.all()
+        queryset = Post.objects.select_related('author').annotate(
+            comments_count=Count('comments', filter=Q(comments__is_approved=True))
+        )
+        if self.action == 'retrieve':
+            queryset = queryset.prefetch_related(Prefetch(
+                'comments',
+                queryset=Comment.objects.filter(is_approved=True).select_related('author').only(
+                    'id', 'post_id', 'content', 'created_at', 'is_approved',
+                    'author__id', 'author__username', 'author__email',
+                    'author__first_name', 'author__last_name'
+                )
+            ))
         
         # Show unpublished posts only to staff
         if not self.request.user.is_staff:
@@ -64,11 +75,9 @@ class PostViewSet(viewsets.ModelViewSet):
         """Get recent published posts - optimized with select_related"""
         posts = (self.get_queryset()
                 .filter(is_published=True)
-                .select_related('author')  # Optimize author queries
-                .prefetch_related('comments')  # Optimize comments count
                 .only('id', 'title', 'content', 'media', 'video_url', 
                       'media_type', 'created_at', 'updated_at', 'is_published',
-                      'author__username', 'author__first_name', 'author__last_name')
+                      'author__username', 'author__email', 'author__first_name', 'author__last_name')
                 .order_by('-created_at')[:3])
         serializer = self.get_serializer(posts, many=True)
         return Response(serializer.data)
@@ -198,6 +207,15 @@ class AcademyVideoViewSet(viewsets.ModelViewSet):
         return Response({'message': 'Video already completed'})
 
 
+def _completed_exercise_ids(user):
+    """IDs of every exercise the user has completed, in a single query"""
+    return set(
+        UserProgress.completed_exercises.through.objects
+        .filter(userprogress__user=user)
+        .values_list('academyexercise_id', flat=True)
+    )
+
+
 class AcademyExerciseViewSet(viewsets.ModelViewSet):
     """
     ViewSet for Academy exercises.
@@ -209,10 +227,20 @@ class AcademyExerciseViewSet(viewsets.ModelViewSet):
     
     def get_queryset(self):
         queryset = AcademyExercise.objects.all()
+        if self.action == 'list':
+            # Never serialized; submit/execute still load them via get_object()
+            queryset = queryset.defer('solution_code', 'test_cases')
         if not self.request.user.is_staff:
             queryset = queryset.filter(is_active=True)
         return queryset
     
+    def get_serializer_context(self):
+        """Load completed exercise ids once instead of once per exercise"""
+        context = super().get_serializer_context()
+        if self.action in ['list', 'retrieve'] and self.request.user.is_authenticated:
+            context['completed_exercise_ids'] = _completed_exercise_ids(self.request.user)
+        return context
+    
     @action(detail=True, methods=['post'])
     def execute(self, request, pk=None):
         """Execute code using Judge0 API - REAL execution for all languages!"""
@@ -1067,12 +1095,15 @@ class UserProgressViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [permissions.IsAuthenticated]
     
     def get_queryset(self):
-        return UserProgress.objects.filter(user=self.request.user)
+        return UserProgress.objects.filter(user=self.request.user).annotate(
+            completed_videos_count=Count('completed_videos', distinct=True),
+            completed_exercises_count=Count('completed_exercises', distinct=True),
+        )
     
     @action(detail=False, methods=['get'])
     def me(self, request):
         """Get current user's progress"""
-        progress, created = UserProgress.objects.get_or_create(user=request.user)
+        progress, created = self.get_queryset().get_or_create(user=request.user)
         serializer = self.get_serializer(progress)
         return Response(serializer.data)
     
@@ -1132,11 +1163,48 @@ class CourseViewSet(viewsets.ModelViewSet):
         return CourseListSerializer
     
     def get_queryset(self):
-        queryset = Course.objects.prefetch_related('items').all()
+        queryset = Course.objects.annotate(
+            items_count=Count('items'),
+            videos_count=Count('items', filter=Q(items__content_type='video')),
+            exercises_count=Count('items', filter=Q(items__content_type='exercise')),
+        )
+        if self.action == 'list' and self.request.user.is_authenticated:
+            # The user's progress columns ride along in the same SELECT
+            progress = UserCourseProgress.objects.filter(user=self.request.user, course=OuterRef('pk'))
+            queryset = queryset.annotate(
+                _progress_started=Subquery(progress.values('is_started')[:1]),
+                _progress_completed=Subquery(progress.values('is_completed')[:1]),
+                _progress_pct=Subquery(progress.values('completion_percentage')[:1]),
+                _current_item_order=Subquery(progress.values('current_item__order')[:1]),
+            )
+        if self.action == 'retrieve':
+            queryset = queryset.prefetch_related(Prefetch(
+                'items',
+                queryset=CourseItem.objects.select_related('video', 'exercise')
+                .defer('exercise__solution_code', 'exercise__test_cases')
+                .order_by('order')
+            ))
+            if self.request.user.is_authenticated:
+                # The user's progress on this course lands on the instance
+                queryset = queryset.prefetch_related(Prefetch(
+                    'user_progress',
+                    queryset=UserCourseProgress.objects.filter(
+                        user=self.request.user
+                    ).select_related('current_item'),
+                    to_attr='_my_progress'
+                ))
         if not self.request.user.is_staff:
             queryset = queryset.filter(is_active=True)
         return queryset
     
+    def get_serializer_context(self):
+        """Load completed exercise ids once for the detail view"""
+        context = super().get_serializer_context()
+        if self.action == 'retrieve' and self.request.user.is_authenticated:
+            # Nested exercise items report is_completed
+            context['completed_exercise_ids'] = _completed_exercise_ids(self.request.user)
+        return context
+    
     @action(detail=True, methods=['post'])
     def start(self, request, pk=None):
         """Start a course (create progress tracking)"""
@@ -1147,6 +1215,7 @@ class CourseViewSet(viewsets.ModelViewSet):
             user=request.user,
             course=course
         )
+        progress.course = course  # Reuse the annotated course for the response
         
         if created or not progress.is_started:
             progress.is_started = True
@@ -1169,6 +1238,7 @@ class CourseViewSet(viewsets.ModelViewSet):
         
         try:
             progress = UserCourseProgress.objects.get(user=request.user, course=course)
+            progress.course = course  # Reuse the annotated course for the response
             serializer = UserCourseProgressSerializer(progress)
             return Response(serializer.data)
         except UserCourseProgress.DoesNotExist:
@@ -1194,15 +1264,12 @@ class CourseViewSet(viewsets.ModelViewSet):
         # Get or create progress
         progress, created = UserCourseProgress.objects.get_or_create(
             user=request.user,
-            course=course
+            course=course,
+            defaults={'is_started': True, 'started_at': timezone.now()}
         )
         
-        if created:
-            progress.is_started = True
-            progress.started_at = timezone.now()
-        
         # Mark item as completed
-        if item not in progress.completed_items.all():
+        if not progress.completed_items.filter(pk=item.pk).exists():
             progress.completed_items.add(item)
             
             # Award XP based on content type
@@ -1214,8 +1281,8 @@ class CourseViewSet(viewsets.ModelViewSet):
             user_progress.add_xp(xp)
             user_progress.check_streak()
         
-        # Update progress percentage
-        progress.calculate_progress()
+        # Update progress percentage (items_count is annotated on the course)
+        progress.calculate_progress(total_items=course.items_count)
         
         # Move to next item
         next_item = item.get_next_item()
@@ -1269,29 +1336,34 @@ class CourseItemViewSet(viewsets.ModelViewSet):
     def navigation(self, request, pk=None):
         """Get navigation info (previous, current, next)"""
         item = self.get_object()
+        content = item.get_content()
+        previous_item = item.get_previous_item()
+        next_item = item.get_next_item()
         
         return Response({
             'current': {
                 'id': item.id,
                 'order': item.order,
                 'content_type': item.content_type,
-                'title': item.get_content().title if item.get_content() else None
+                'title': content.title if content else None
             },
             'previous': {
-                'id': item.get_previous_item().id,
-                'order': item.get_previous_item().order
-            } if item.get_previous_item() else None,
+                'id': previous_item.id,
+                'order': previous_item.order
+            } if previous_item else None,
             'next': {
-                'id': item.get_next_item().id,
-                'order': item.get_next_item().order
-            } if item.get_next_item() else None,
+                'id': next_item.id,
+                'order': next_item.order
+            } if next_item else None,
             'course_progress': self._get_course_progress(item.course)
         })
     
     def _get_course_progress(self, course):
         """Helper to get course progress"""
         try:
-            progress = UserCourseProgress.objects.get(user=self.request.user, course=course)
+            progress = UserCourseProgress.objects.select_related('current_item').get(
+                user=self.request.user, course=course
+            )
             return {
                 'completion_percentage': progress.completion_percentage,
                 'current_item_order': progress.current_item.order if progress.current_item else None
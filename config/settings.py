@@ -144,6 +144,11 @@ REST_FRAMEWORK = {
         'rest_framework.filters.SearchFilter',
         'rest_framework.filters.OrderingFilter',
     ],
+    # Plain JSON only in production; the browsable API re-renders forms per request
+    'DEFAULT_RENDERER_CLASSES': (
+        ('rest_framework.renderers.JSONRenderer', 'rest_framework.renderers.BrowsableAPIRenderer')
+        if DEBUG else ('rest_framework.renderers.JSONRenderer',)
+    ),
 }
 
 # JWT Settings
@@ -166,6 +171,9 @@ CORS_ALLOW_CREDENTIALS = True
 
 # Google Gemini API Key for AI-powered code evaluation
 GEMINI_API_KEY = config('GEMINI_API_KEY', default='')
+# Reuse Gemini evaluations for identical prompts (seconds)
+GEMINI_CACHE_ENABLED = config('GEMINI_CACHE_ENABLED', default=True, cast=bool)
+GEMINI_CACHE_TIMEOUT = config('GEMINI_CACHE_TIMEOUT', default=86400, cast=int)
 
 # Static files (CSS, JavaScript, Images)
 STATIC_URL = '/static/'